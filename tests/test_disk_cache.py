@@ -0,0 +1,38 @@
+import os
+
+import pandas as pd
+
+from utils.disk_cache import QueryDiskCache, query_cache_key
+
+
+def test_query_cache_key_ignores_whitespace():
+    assert query_cache_key("SELECT  a\nFROM t") == query_cache_key(" SELECT a FROM t ")
+    assert query_cache_key("SELECT a FROM t") != query_cache_key("SELECT b FROM t")
+
+
+def test_round_trip_and_expiry(tmp_path):
+    cache = QueryDiskCache(str(tmp_path), ttl=60)
+    df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+    assert cache.get('k') is None
+    cache.put('k', df)
+    pd.testing.assert_frame_equal(cache.get('k'), df)
+
+    written = os.stat(tmp_path / 'k.parquet').st_mtime
+    os.utime(tmp_path / 'k.parquet', (written, written - 120))
+    assert cache.get('k') is None
+    assert not (tmp_path / 'k.parquet').exists()
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = QueryDiskCache(str(tmp_path), max_bytes=10 ** 9)
+    df = pd.DataFrame({'a': range(1000)})
+    for i, key in enumerate(('a', 'b', 'c')):
+        cache.put(key, df)
+        path = tmp_path / f'{key}.parquet'
+        os.utime(path, (1000 + i, os.stat(path).st_mtime))
+    size = os.stat(tmp_path / 'a.parquet').st_size
+    cache.max_bytes = 2 * size
+    cache.evict()
+    assert sorted(os.listdir(tmp_path)) == ['b.parquet', 'c.parquet']
+    assert cache.stats()['evictions'] == 1
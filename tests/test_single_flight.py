@@ -0,0 +1,44 @@
+import threading
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls, results = [], []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return 'result'
+
+    leader = threading.Thread(target=lambda: results.append(flight.do('k', work)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(flight.do('k', work))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.waiters('k') < 3:
+        pass
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ['result'] * 4
+    assert flight.stats() == {'executed': 1, 'coalesced': 3, 'in_flight': 0}
+
+
+def test_errors_are_raised_and_not_kept():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        flight.do('k', fail)
+    assert flight.do('k', lambda: 1) == 1
@@ -0,0 +1,151 @@
+"""
+Process-wide BigQuery client pool.
+
+Creating a ``bigquery.Client`` parses the service account key, fetches an
+access token and opens a fresh HTTP session. This module keeps a small,
+bounded set of long-lived clients that share a single credentials object,
+so every query only pays for its own round-trip.
+"""
+
+import threading
+from contextlib import contextmanager
+
+import streamlit as st
+from google.cloud import bigquery
+from google.oauth2 import service_account
+
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # Storage Read API is optional; results fall back to REST paging
+    bigquery_storage = None
+
+# BigQuery API scope for the service account
+BIGQUERY_SCOPES = ['https://www.googleapis.com/auth/cloud-platform']
+
+# Matches the number of workers used for parallel queries
+DEFAULT_POOL_SIZE = 5
+
+
+class BigQueryClientPool:
+    """
+    Bounded, thread-safe pool of BigQuery clients.
+
+    All clients share one credentials object. google-auth refreshes the
+    access token on it before a request whenever it is missing or expired,
+    so the pool never has to rebuild a client to get a new token.
+    """
+
+    def __init__(self, credentials_info, size: int = DEFAULT_POOL_SIZE):
+        self.size = max(1, int(size))
+        self.credentials = service_account.Credentials.from_service_account_info(
+            dict(credentials_info), scopes=BIGQUERY_SCOPES
+        )
+        self.project = self.credentials.project_id
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle: list[bigquery.Client] = []
+        self._storage_client = None
+        self._created = 0
+        self._in_use = 0
+        self._acquired = 0
+        self._waits = 0
+
+    def _new_client(self) -> bigquery.Client:
+        return bigquery.Client(credentials=self.credentials, project=self.project)
+
+    def _acquire(self) -> bigquery.Client:
+        # Block when every client is checked out, but count the wait
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._waits += 1
+            self._slots.acquire()
+
+        with self._lock:
+            self._in_use += 1
+            self._acquired += 1
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            return self._new_client()
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+                self._created -= 1
+            self._slots.release()
+            raise
+
+    def _release(self, client: bigquery.Client) -> None:
+        with self._lock:
+            self._in_use -= 1
+            self._idle.append(client)
+        self._slots.release()
+
+    @contextmanager
+    def client(self):
+        """
+        Check out a client for the duration of the ``with`` block.
+        """
+        client = self._acquire()
+        try:
+            yield client
+        finally:
+            self._release(client)
+
+    def storage_client(self):
+        """
+        Return the shared BigQuery Storage Read client, or None if
+        ``google-cloud-bigquery-storage`` is not installed.
+
+        The gRPC client is thread-safe, so one instance serves the whole process.
+        """
+        if bigquery_storage is None:
+            return None
+        with self._lock:
+            if self._storage_client is None:
+                self._storage_client = bigquery_storage.BigQueryReadClient(credentials=self.credentials)
+            return self._storage_client
+
+    def stats(self) -> dict:
+        """
+        Return a snapshot of pool usage counters.
+        """
+        with self._lock:
+            return {
+                'size': self.size,
+                'created': self._created,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'acquired': self._acquired,
+                'waits': self._waits,
+                'storage_api': self._storage_client is not None,
+                'token_valid': self.credentials.valid,
+                'token_expiry': self.credentials.expiry,
+            }
+
+    def close(self) -> None:
+        """
+        Close all idle clients. Checked-out clients are returned to the pool as usual.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+        for client in idle:
+            client.close()
+
+
+@st.cache_resource(show_spinner=False)
+def get_client_pool() -> BigQueryClientPool:
+    """
+    Return the pool shared by every session and worker thread in this process.
+
+    The pool size can be set with ``POOL_SIZE`` under the ``BIGQUERY``
+    section of Streamlit secrets.
+    """
+    config = st.secrets.get("BIGQUERY", {})
+    return BigQueryClientPool(
+        st.secrets["GOOGLE_CREDENTIALS_JSON"],
+        size=config.get("POOL_SIZE", DEFAULT_POOL_SIZE),
+    )
@@ -0,0 +1,179 @@
+"""
+Persistent on-disk cache for query results.
+
+Sits below the in-memory ``st.cache_data`` layer so that a deploy or a crash
+does not cold-start every page against BigQuery. Results are stored as
+zstd-compressed Parquet files named after a hash of the query text.
+
+- TTL is measured from the file's modification time (when it was written).
+- LRU order uses the access time, which is bumped explicitly on every hit.
+- Writes go to a temporary file that is atomically renamed into place, so
+  concurrent sessions never see a half-written file.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Optional
+
+import pandas as pd
+import streamlit as st
+
+CACHE_SUFFIX = '.parquet'
+
+
+def query_cache_key(query: str) -> str:
+    """
+    Return a stable file-name-safe key for a query.
+    """
+    text = re.sub(r'\s+', ' ', str(query)).strip()
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class QueryDiskCache:
+    """
+    Size-bounded, TTL-aware Parquet cache directory.
+    """
+
+    def __init__(self, directory: str, ttl: float = 3600, max_bytes: int = 1024 ** 3):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{CACHE_SUFFIX}")
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame for ``key``, or None on a miss or expired entry.
+        """
+        path = self._path(key)
+        try:
+            written_at = os.stat(path).st_mtime
+            if time.time() - written_at > self.ttl:
+                os.remove(path)
+                self._count('_misses')
+                return None
+            df = pd.read_parquet(path)
+            # Mark as recently used without touching the write time
+            os.utime(path, (time.time(), written_at))
+        except FileNotFoundError:
+            # Missing, or removed by another session between stat and read
+            self._count('_misses')
+            return None
+        except Exception as e:
+            print(f"Error reading cached query result: {str(e)}")
+            self._count('_misses')
+            return None
+
+        self._count('_hits')
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Atomically write ``df`` under ``key`` and evict old entries if over budget.
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                df.to_parquet(f, compression='zstd', index=False)
+            os.replace(tmp_path, self._path(key))
+            tmp_path = None
+            self._count('_writes')
+        except Exception as e:
+            print(f"Error writing cached query result: {str(e)}")
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict()
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits in ``max_bytes``.
+        """
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    self._evictions += 1
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def clear(self) -> None:
+        """
+        Remove every cached result.
+        """
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> dict:
+        """
+        Return hit/miss/write/eviction counters and the current size on disk.
+        """
+        entries = self._entries()
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'writes': self._writes,
+                'evictions': self._evictions,
+                'entries': len(entries),
+                'bytes': sum(size for _, size, _ in entries),
+                'max_bytes': self.max_bytes,
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_disk_cache() -> Optional[QueryDiskCache]:
+    """
+    Return the process-wide query result cache, or None if it is disabled.
+
+    Configured under the ``BIGQUERY`` section of Streamlit secrets with
+    ``DISK_CACHE`` (on/off), ``DISK_CACHE_DIR``, ``DISK_CACHE_TTL`` (seconds)
+    and ``DISK_CACHE_MAX_BYTES``.
+    """
+    config = st.secrets.get("BIGQUERY", {})
+    if str(config.get("DISK_CACHE", True)).lower() in ("false", "0"):
+        return None
+    return QueryDiskCache(
+        directory=config.get("DISK_CACHE_DIR", ".cache/query_results"),
+        ttl=float(config.get("DISK_CACHE_TTL", 3600)),
+        max_bytes=int(config.get("DISK_CACHE_MAX_BYTES", 1024 ** 3)),
+    )
@@ -1,16 +1,45 @@
 import re
-from google.cloud import bigquery
 import pandas as pd
 import streamlit as st
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import time
+import threading
+from collections import deque
+
+from .bq_pool import get_client_pool
+from .disk_cache import get_disk_cache, query_cache_key
+from .single_flight import SingleFlight
+
+BQ_CONFIG = st.secrets.get("BIGQUERY", {})
+# Results with at least this many rows are downloaded through the Storage Read API
+ARROW_MIN_ROWS = int(BQ_CONFIG.get("ARROW_MIN_ROWS", 50_000))
+
+# Recent per-query download stats, shared by all sessions
+QUERY_LOG = deque(maxlen=int(BQ_CONFIG.get("QUERY_LOG_SIZE", 500)))
+_query_log_lock = threading.Lock()
+
+# Identical queries running at the same time share one load
+_in_flight = SingleFlight()
+
+def _record_query(**stats) -> None:
+    with _query_log_lock:
+        QUERY_LOG.append(stats)
+
+def query_stats() -> pd.DataFrame:
+    """
+    Return recent query download stats (rows, bytes, seconds, rows/sec, path) as a DataFrame.
+    """
+    with _query_log_lock:
+        return pd.DataFrame(list(QUERY_LOG))
 
 # Context manager for BigQuery operations
 class BigQueryExecutor:
     def __init__(self):
-        # Load credentials from Streamlit secrets
-        self.credentials = st.secrets["GOOGLE_CREDENTIALS_JSON"]
+        # Shared, process-wide client pool (credentials are parsed once)
+        self.pool = get_client_pool()
+        # Persistent result cache that survives restarts (None if disabled)
+        self.disk_cache = get_disk_cache()
 
     def __enter__(self):
         return self
@@ -19,32 +48,103 @@ class BigQueryExecutor:
         pass
 
     @st.cache_data(ttl=3600, show_spinner=False)
-    def exacute_query(_self, query: str) -> pd.DataFrame:
+    def exacute_query(_self, query: str, use_arrow: bool | None = None) -> pd.DataFrame:
         """
         Execute a BigQuery query and return the results as a DataFrame.
+
+        Results are streamed as Arrow record batches through the BigQuery
+        Storage Read API when ``use_arrow`` is True, or when it is None and the
+        result has at least ``ARROW_MIN_ROWS`` rows. Otherwise the paged REST
+        path is used.
+
+        Results are also kept in the on-disk cache, which is checked before
+        BigQuery so a restarted process does not have to re-run every query.
+        Concurrent calls for the same query (e.g. several sessions opening
+        the home page at once) share a single in-flight load.
         """
-        start = time.time()
         try:
             # Clean up query for logging (remove extra whitespace, truncate if too long)
             query_preview = re.sub(r'\s+', ' ', str(query))
             if len(query_preview) > 200:
                 query_preview = f"{query_preview[:100]} ... {query_preview[-100:]}"
 
-            # Create BigQuery client using credentials
-            client = bigquery.Client.from_service_account_info(_self.credentials)
-            # Run the query and convert to DataFrame
-            df = client.query(query).to_dataframe(create_bqstorage_client=False)
-            client.close()
-
-            end = time.time()
-            # print(f"Query Executed: {query_preview} \n time:{end-start}s")
-
-            return df
+            cache_key = query_cache_key(query)
+            return _in_flight.do(
+                cache_key, lambda: _self._load(query, cache_key, query_preview, use_arrow)
+            )
 
         except Exception as e:
             print(f"Error executing query: {str(e)}")
             return None
 
+    def _load(self, query: str, cache_key: str, query_preview: str, use_arrow: bool | None) -> pd.DataFrame:
+        # Load a query result from the disk cache, or from BigQuery on a miss
+        start = time.time()
+        if self.disk_cache is not None:
+            df = self.disk_cache.get(cache_key)
+            if df is not None:
+                _record_query(
+                    query=query_preview,
+                    path='disk',
+                    rows=len(df),
+                    bytes=int(df.memory_usage(index=True).sum()),
+                    seconds=round(time.time() - start, 3),
+                )
+                return df
+
+        # Borrow a pooled client and run the query
+        with self.pool.client() as client:
+            rows = client.query(query).result()
+            storage_client = None
+            if use_arrow or (use_arrow is None and (rows.total_rows or 0) >= ARROW_MIN_ROWS):
+                storage_client = self.pool.storage_client()
+            download_start = time.time()
+            df = rows.to_dataframe(bqstorage_client=storage_client, create_bqstorage_client=False)
+
+        end = time.time()
+        download_seconds = end - download_start
+        _record_query(
+            query=query_preview,
+            path='arrow' if storage_client is not None else 'rest',
+            rows=len(df),
+            bytes=int(df.memory_usage(index=True).sum()),
+            seconds=round(end - start, 3),
+            download_seconds=round(download_seconds, 3),
+            rows_per_sec=round(len(df) / download_seconds, 1) if download_seconds > 0 else None,
+        )
+        if self.disk_cache is not None:
+            self.disk_cache.put(cache_key, df)
+
+        return df
+
+    def pool_stats(self) -> dict:
+        """
+        Return usage counters of the shared BigQuery client pool.
+        """
+        return self.pool.stats()
+
+    def disk_cache_stats(self) -> dict:
+        """
+        Return usage counters of the on-disk result cache.
+        """
+        return self.disk_cache.stats() if self.disk_cache is not None else {}
+
+    def cache_stats(self) -> dict:
+        """
+        Return process-wide hit, miss and coalesced counts for query loads.
+
+        Hits are served from the disk cache, misses went to BigQuery and
+        coalesced calls waited on an identical query that was already running.
+        """
+        flight = _in_flight.stats()
+        hits = self.disk_cache_stats().get('hits', 0)
+        return {
+            'hits': hits,
+            'misses': flight['executed'] - hits,
+            'coalesced': flight['coalesced'],
+            'in_flight': flight['in_flight'],
+        }
+
     async def run_query_async(self, query: str, executor):
         # Run a blocking query in a thread pool executor asynchronously
         loop = asyncio.get_event_loop()
@@ -0,0 +1,70 @@
+"""
+Single-flight request coalescing.
+
+When several callers ask for the same key at the same time, only the first
+one (the leader) runs the work; the others wait for it and share its result
+or its exception.
+"""
+
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Thread-safe registry of in-flight calls keyed by a string.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: str, fn):
+        """
+        Run ``fn()`` for ``key`` unless an identical call is already running,
+        in which case wait for that call and return its result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        """
+        Return how many calls ran and how many were coalesced onto a running one.
+        """
+        with self._lock:
+            return {
+                'executed': self._executed,
+                'coalesced': self._coalesced,
+                'in_flight': len(self._calls),
+            }